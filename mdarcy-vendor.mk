@@ -904,7 +904,12 @@ PRODUCT_COPY_FILES += \
     vendor/nvidia/mdarcy/proprietary/vendor/lib64/python2.6/nvcamera_v1/nvcamera_v1.py:$(TARGET_COPY_OUT_VENDOR)/lib64/python2.6/nvcamera_v1/nvcamera_v1.py \
     vendor/nvidia/mdarcy/proprietary/vendor/lib64/python2.6/nvcamera_v1/version_v1.py:$(TARGET_COPY_OUT_VENDOR)/lib64/python2.6/nvcamera_v1/version_v1.py \
     vendor/nvidia/mdarcy/proprietary/vendor/lib64/python2.6/nvcameraimageutils.py:$(TARGET_COPY_OUT_VENDOR)/lib64/python2.6/nvcameraimageutils.py \
+    vendor/nvidia/mdarcy/proprietary/vendor/lib64/python2.6/nvcapturepipeline.py:$(TARGET_COPY_OUT_VENDOR)/lib64/python2.6/nvcapturepipeline.py \
+    vendor/nvidia/mdarcy/proprietary/vendor/lib64/python2.6/nvfocussweep.py:$(TARGET_COPY_OUT_VENDOR)/lib64/python2.6/nvfocussweep.py \
+    vendor/nvidia/mdarcy/proprietary/vendor/lib64/python2.6/nvperfcounters.py:$(TARGET_COPY_OUT_VENDOR)/lib64/python2.6/nvperfcounters.py \
     vendor/nvidia/mdarcy/proprietary/vendor/lib64/python2.6/nvraw_v3.py:$(TARGET_COPY_OUT_VENDOR)/lib64/python2.6/nvraw_v3.py \
+    vendor/nvidia/mdarcy/proprietary/vendor/lib64/python2.6/nvrawbenchmark.py:$(TARGET_COPY_OUT_VENDOR)/lib64/python2.6/nvrawbenchmark.py \
+    vendor/nvidia/mdarcy/proprietary/vendor/lib64/python2.6/nvrawdecode.py:$(TARGET_COPY_OUT_VENDOR)/lib64/python2.6/nvrawdecode.py \
     vendor/nvidia/mdarcy/proprietary/vendor/lib64/python2.6/nvrawfile.py:$(TARGET_COPY_OUT_VENDOR)/lib64/python2.6/nvrawfile.py \
     vendor/nvidia/mdarcy/proprietary/vendor/lib64/python2.6/nvrawfileV3.py:$(TARGET_COPY_OUT_VENDOR)/lib64/python2.6/nvrawfileV3.py \
     vendor/nvidia/mdarcy/proprietary/vendor/lib64/python2.6/nvrawfile_pinterface.py:$(TARGET_COPY_OUT_VENDOR)/lib64/python2.6/nvrawfile_pinterface.py \